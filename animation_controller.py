@@ -3,12 +3,34 @@ BlackRoad Animation Controller
 Skeletal animation with FK/IK, clip blending, and sprite support.
 """
 
+import bisect
+import functools
 import json
 import math
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional: kernels run as plain Python
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # optional: export_frame_bytes falls back to json
+    orjson = None
+
+
+def _jit(fn):
+    """Compile a hot-loop kernel with Numba when it is installed."""
+    if njit is None:
+        return fn
+    return njit(fastmath=True, cache=True)(fn)
 
 
 # ---------------------------------------------------------------------------
@@ -34,31 +56,190 @@ class InterpolationType(str, Enum):
     CUBIC = "cubic"
 
 
+# Small-int easing codes baked into clips for the sampling hot path
+_EASE_LINEAR, _EASE_STEP, _EASE_CUBIC = 0, 1, 2
+_EASING_CODES = {
+    InterpolationType.LINEAR: _EASE_LINEAR,
+    InterpolationType.STEP: _EASE_STEP,
+    InterpolationType.CUBIC: _EASE_CUBIC,
+}
+
+
 # ---------------------------------------------------------------------------
 # Bone
 # ---------------------------------------------------------------------------
 
-@dataclass
+def _bone_field(name: str) -> property:
+    """Bone attribute backed by the owning skeleton's array of the same name."""
+    local = "_" + name  # also the skeleton's storage for the column
+
+    def fget(self) -> float:
+        sk = self._layout()
+        if sk is None:
+            return getattr(self, local)
+        return float(getattr(sk, local)[self._index])
+
+    def fset(self, value: float):
+        sk = self._layout()
+        if sk is None:
+            setattr(self, local, value)
+        else:
+            getattr(sk, local)[self._index] = value
+            sk._dirty = True
+
+    return property(fget, fset)
+
+
+def _tip_field(name: str, trig: Callable[[float], float]) -> property:
+    """Bone end point: the skeleton's FK/IK output, or derived when standalone."""
+    origin = "world_x" if name == "tip_x" else "world_y"
+    column = "_" + name
+
+    def fget(self) -> float:
+        sk = self._layout()
+        if sk is None:
+            return getattr(self, origin) + self.length * trig(self.world_angle)
+        return float(getattr(sk, column)[self._index])
+
+    return property(fget)
+
+
+# Per-bone numeric state stored column-wise on the skeleton (SoA)
+_BONE_COLUMNS = (
+    "length", "rest_angle", "current_angle",
+    "world_x", "world_y", "world_angle",
+)
+# Skeleton columns: the bone state plus the tips written by FK/IK
+_LAYOUT_COLUMNS = _BONE_COLUMNS + ("tip_x", "tip_y")
+
+
 class Bone:
-    """A single bone in a skeleton."""
-    id: int
-    name: str
-    parent_id: Optional[int]
-    length: float = 1.0
-    rest_angle: float = 0.0       # radians, default orientation
-    current_angle: float = 0.0    # current animated angle
-    world_x: float = 0.0
-    world_y: float = 0.0
-    world_angle: float = 0.0
-    weight: float = 1.0           # for blending
+    """
+    A single bone in a skeleton.
+    Standalone bones hold their own values; once added to a Skeleton the
+    numeric fields read and write that skeleton's per-bone arrays. Not a
+    dataclass: bones compare by value, but dataclasses.asdict/replace do
+    not apply (use to_dict, or build a new Bone).
+    """
+
+    __slots__ = ("_id", "_name", "_parent_id", "weight", "_owner", "_skeleton", "_index") + tuple(
+        "_" + name for name in _BONE_COLUMNS
+    )
+
+    length = _bone_field("length")
+    rest_angle = _bone_field("rest_angle")        # radians, default orientation
+    current_angle = _bone_field("current_angle")  # current animated angle
+    world_x = _bone_field("world_x")
+    world_y = _bone_field("world_y")
+    world_angle = _bone_field("world_angle")
+    tip_x = _tip_field("tip_x", math.cos)
+    tip_y = _tip_field("tip_y", math.sin)
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        parent_id: Optional[int],
+        length: float = 1.0,
+        rest_angle: float = 0.0,
+        current_angle: float = 0.0,
+        world_x: float = 0.0,
+        world_y: float = 0.0,
+        world_angle: float = 0.0,
+        weight: float = 1.0,      # for blending
+    ):
+        self._owner: Optional["Skeleton"] = None     # skeleton whose bone table holds this bone
+        self._skeleton: Optional["Skeleton"] = None  # skeleton whose arrays hold its values
+        self._index: int = -1
+        self._id = id
+        self._name = name
+        self._parent_id = parent_id
+        self.length = length
+        self.rest_angle = rest_angle
+        self.current_angle = current_angle
+        self.world_x = world_x
+        self.world_y = world_y
+        self.world_angle = world_angle
+        self.weight = weight
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @id.setter
+    def id(self, value: int):
+        if self._owner is not None:
+            raise ValueError(
+                f"Bone {self._id} belongs to a skeleton; remove_bone() it before changing its id"
+            )
+        self._id = value
 
     @property
-    def tip_x(self) -> float:
-        return self.world_x + self.length * math.cos(self.world_angle)
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        if self._owner is not None:
+            self._owner._rename(self, value)
+        else:
+            self._name = value
 
     @property
-    def tip_y(self) -> float:
-        return self.world_y + self.length * math.sin(self.world_angle)
+    def parent_id(self) -> Optional[int]:
+        return self._parent_id
+
+    @parent_id.setter
+    def parent_id(self, value: Optional[int]):
+        if self._owner is not None:
+            self._owner._reparent(self, value)
+        else:
+            self._parent_id = value
+
+    def __repr__(self) -> str:
+        return (
+            f"Bone(id={self.id!r}, name={self.name!r}, parent_id={self.parent_id!r}, "
+            f"length={self.length!r}, rest_angle={self.rest_angle!r}, "
+            f"current_angle={self.current_angle!r}, world_x={self.world_x!r}, "
+            f"world_y={self.world_y!r}, world_angle={self.world_angle!r}, weight={self.weight!r})"
+        )
+
+    def _key(self) -> tuple:
+        return (
+            self.id, self.name, self.parent_id, self.length, self.rest_angle,
+            self.current_angle, self.world_x, self.world_y, self.world_angle, self.weight,
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # mutable, compared by value
+
+    def _layout(self) -> Optional["Skeleton"]:
+        """The owning skeleton with its layout up to date, or None if standalone."""
+        sk = self._skeleton
+        if sk is not None and sk._layout_stale:
+            sk._finalize()
+            sk = self._skeleton  # the rebuild may have dropped this bone
+        return sk
+
+    def _bind(self, skeleton: "Skeleton", index: int):
+        self._skeleton = skeleton
+        self._index = index
+
+    def _unbind(self):
+        """Detach from the skeleton, copying the array-backed values back locally."""
+        if self._skeleton is None:
+            return
+        self._detach({name: getattr(self, name) for name in _BONE_COLUMNS})
+
+    def _detach(self, values: Dict[str, float]):
+        self._skeleton = None
+        self._index = -1
+        for name, value in values.items():
+            setattr(self, name, value)
 
     def to_dict(self) -> dict:
         return {
@@ -79,31 +260,247 @@ class Bone:
 # Skeleton
 # ---------------------------------------------------------------------------
 
+def _layout_field(name: str) -> property:
+    """Read-only Skeleton array; reading it brings a stale layout up to date."""
+    storage = "_" + name
+
+    def fget(self):
+        if self._layout_stale:
+            self._finalize()
+        return getattr(self, storage)
+
+    return property(fget)
+
+
 class Skeleton:
-    """Hierarchical bone structure."""
+    """
+    Hierarchical bone structure.
+    Bone state lives in parallel NumPy arrays (``length``, ``rest_angle``,
+    ``current_angle``, ``world_x``, ``world_y``, ``world_angle``) indexed by
+    row, with rows in breadth-first order so every parent precedes its
+    children. Bones not reachable from a root get no row and are left
+    untouched by FK.
+    ``_dirty`` is set by any change that invalidates the world transforms
+    and cleared by FK; code writing the arrays directly calls mark_dirty().
+    add_bone only marks the layout stale; it is rebuilt by _ensure_layout()
+    on the next FK, IK, export or array read, so adding bones stays linear.
+    """
+
+    ids = _layout_field("ids")
+    names = _layout_field("names")
+    parent_idx = _layout_field("parent_idx")
+    length = _layout_field("length")
+    rest_angle = _layout_field("rest_angle")
+    current_angle = _layout_field("current_angle")
+    world_x = _layout_field("world_x")
+    world_y = _layout_field("world_y")
+    world_angle = _layout_field("world_angle")
+    tip_x = _layout_field("tip_x")
+    tip_y = _layout_field("tip_y")
 
     def __init__(self, bones: Optional[List[Bone]] = None):
-        self.bones: Dict[int, Bone] = {}
-        self.root_x: float = 0.0
-        self.root_y: float = 0.0
+        self._bones: Dict[int, Bone] = {}
+        self._bones_view = MappingProxyType(self._bones)
+        self._root_x: float = 0.0
+        self._root_y: float = 0.0
+        self._dirty: bool = True
+        self._children_of: Dict[Optional[int], List[int]] = {}
+        self._by_name: Dict[str, Bone] = {}
+        self._ordered_bones: List[Bone] = []  # sorted by id
+        self._layout_stale: bool = True
         if bones:
             for b in bones:
-                self.bones[b.id] = b
+                self._attach(b)
+        self._finalize()
+
+    def _ensure_layout(self):
+        """Rebuild the SoA layout if bones were added since the last build."""
+        if self._layout_stale:
+            self._finalize()
+
+    @property
+    def bones(self) -> Mapping[int, Bone]:
+        """Read-only view of the bones by id; change it with add_bone/remove_bone."""
+        return self._bones_view
+
+    def _attach(self, bone: Bone):
+        old = self._bones.get(bone.id)
+        if old is bone:
+            return
+        if old is not None:
+            old._unbind()
+        self._bones[bone.id] = bone  # a replacement keeps the old bone's slot
+        if old is not None:
+            self._unindex(old)
+        bone._owner = self
+        self._children_of.setdefault(bone.parent_id, []).append(bone.id)
+        self._by_name.setdefault(bone.name, bone)
+        bisect.insort(self._ordered_bones, bone, key=lambda b: b.id)
+
+    def _unindex(self, bone: Bone):
+        """Drop a bone that has left ``_bones`` from the lookup indexes."""
+        self._children_of[bone.parent_id].remove(bone.id)
+        del self._ordered_bones[bisect.bisect_left(self._ordered_bones, bone.id, key=lambda b: b.id)]
+        bone._owner = None
+        if self._by_name.get(bone.name) is bone:
+            self._rebuild_names()
+
+    def _rebuild_names(self):
+        # First bone by insertion order wins, as with a scan of ``bones``
+        self._by_name = {}
+        for b in self._bones.values():
+            self._by_name.setdefault(b.name, b)
+
+    def _reparent(self, bone: Bone, parent_id: Optional[int]):
+        self._children_of[bone.parent_id].remove(bone.id)
+        bone._parent_id = parent_id
+        self._children_of.setdefault(parent_id, []).append(bone.id)
+        self._layout_stale = True
+        self._dirty = True
+
+    def _rename(self, bone: Bone, name: str):
+        bone._name = name
+        self._rebuild_names()
+        self._layout_stale = True  # ``names`` follows the layout
+
+    def _topo_order(self) -> List[int]:
+        """Bone ids reachable from the roots, parents before children."""
+        order = list(self._children_of.get(None, ()))
+        for bid in order:  # grows while iterating: breadth-first
+            order.extend(self._children_of.get(bid, ()))
+        return order
+
+    def _finalize(self):
+        """Rebuild the SoA layout from ``self._bones``."""
+        order = self._topo_order()
+        index_of = {bid: i for i, bid in enumerate(order)}
+        ordered = [self._bones[bid] for bid in order]
+        # Bones bound here read from the previous columns, others from themselves
+        self._layout_stale = False
+        prev = {name: getattr(self, "_" + name, None) for name in _LAYOUT_COLUMNS}
+        columns = {
+            name: np.array(
+                [prev[name][b._index] if b._skeleton is self else getattr(b, name) for b in ordered],
+                dtype=np.float64,
+            )
+            for name in _LAYOUT_COLUMNS
+        }
+        for b in self._bones.values():
+            if b._skeleton is self and b.id not in index_of:
+                b._detach({name: float(prev[name][b._index]) for name in _BONE_COLUMNS})
+
+        n = len(order)
+        self._ids = np.array(order, dtype=np.int64)
+        self._names: List[str] = [b.name for b in ordered]
+        self._parent_idx = np.array(
+            [index_of[b.parent_id] if b.parent_id is not None else -1 for b in ordered],
+            dtype=np.int32,
+        )
+        self._length = columns["length"]
+        self._rest_angle = columns["rest_angle"]
+        self._current_angle = columns["current_angle"]
+        self._world_x = columns["world_x"]
+        self._world_y = columns["world_y"]
+        self._world_angle = columns["world_angle"]
+        self._tip_x = columns["tip_x"]
+        self._tip_y = columns["tip_y"]
+        self._parent_rows: List[int] = self._parent_idx.tolist()
+        self._fk_fn: Optional[Callable] = None
+        self._dx = np.empty(n, dtype=np.float64)  # tip offsets, level-wise FK scratch
+        self._dy = np.empty(n, dtype=np.float64)
+        self._chains: Dict[int, Tuple[List[int], np.ndarray]] = {}  # IK chain rows by end bone
+        self._views: Optional[Tuple[memoryview, ...]] = None
+        self._index_of = index_of
+        for i, b in enumerate(ordered):
+            b._bind(self, i)
+
+        # Breadth-first order keeps each depth contiguous: (start, stop, parent rows)
+        depth = [0] * n
+        for i, p in enumerate(self._parent_rows):
+            if p >= 0:
+                depth[i] = depth[p] + 1
+        self._levels: List[Tuple[int, int, np.ndarray]] = []
+        start = 0
+        for i in range(1, n + 1):
+            if i == n or depth[i] != depth[start]:
+                self._levels.append((start, i, self._parent_idx[start:i].copy()))
+                start = i
 
     def add_bone(self, bone: Bone):
-        self.bones[bone.id] = bone
+        self._attach(bone)
+        self._layout_stale = True
+        self._dirty = True
+
+    def remove_bone(self, bone_id: int) -> Bone:
+        """
+        Remove a bone and return it, detached with its current values.
+        Its children stay in the skeleton but get no row (and no FK) until
+        a bone with that id is added again.
+        """
+        bone = self._bones.get(bone_id)
+        if bone is None:
+            raise ValueError(f"Bone {bone_id} not found")
+        bone._unbind()
+        del self._bones[bone_id]
+        self._unindex(bone)
+        self._layout_stale = True
+        self._dirty = True
+        return bone
+
+    @property
+    def root_x(self) -> float:
+        return self._root_x
+
+    @root_x.setter
+    def root_x(self, value: float):
+        self._root_x = value
+        self._dirty = True
+
+    @property
+    def root_y(self) -> float:
+        return self._root_y
+
+    @root_y.setter
+    def root_y(self, value: float):
+        self._root_y = value
+        self._dirty = True
+
+    def compile_fk(self) -> Callable:
+        """
+        Straight-line FK for this skeleton's topology, generated once and
+        shared by every skeleton with the same parent layout (the most
+        recently used topologies stay cached). Called as
+        ``fk(rest_angle, current_angle, length, root_x, root_y,
+        world_x, world_y, world_angle, tip_x, tip_y)``.
+        """
+        self._ensure_layout()
+        if self._fk_fn is None:
+            self._fk_fn = _compile_fk(tuple(self._parent_rows))
+        return self._fk_fn
+
+    def mark_dirty(self):
+        """Flag the world transforms as stale after writing the arrays directly."""
+        self._dirty = True
+
+    def set_current_angle(self, bone_id: int, angle: float):
+        self._ensure_layout()
+        row = self._index_of.get(bone_id)
+        if row is not None:
+            self._current_angle[row] = angle
+        elif bone_id in self._bones:
+            self._bones[bone_id].current_angle = angle  # no row in the layout
+        else:
+            raise ValueError(f"Bone {bone_id} not found")
+        self._dirty = True
 
     def get_bone(self, bone_id: int) -> Optional[Bone]:
-        return self.bones.get(bone_id)
+        return self._bones.get(bone_id)
 
     def get_bone_by_name(self, name: str) -> Optional[Bone]:
-        for b in self.bones.values():
-            if b.name == name:
-                return b
-        return None
+        return self._by_name.get(name)
 
     def get_children(self, parent_id: int) -> List[Bone]:
-        return [b for b in self.bones.values() if b.parent_id == parent_id]
+        return [self._bones[bid] for bid in self._children_of.get(parent_id, ())]
 
     def get_chain(self, end_bone_id: int) -> List[Bone]:
         """Return chain from root to end_bone_id."""
@@ -119,41 +516,492 @@ class Skeleton:
             bid = bone.parent_id
         return chain[::-1]
 
+    def _chain_rows(self, end_bone_id: int) -> Optional[Tuple[List[int], np.ndarray]]:
+        """
+        Layout rows from the root down to end_bone_id (the rows of
+        get_chain), as a list and an array; None if the bone has no row.
+        Cached until the layout is rebuilt.
+        """
+        chain = self._chains.get(end_bone_id)
+        if chain is None:
+            row = self._index_of.get(end_bone_id)
+            if row is None:
+                return None
+            rows = []
+            while row >= 0:
+                rows.append(row)
+                row = self._parent_rows[row]
+            rows.reverse()
+            chain = self._chains[end_bone_id] = (rows, np.array(rows, dtype=np.intp))
+        return chain
+
+    def _column_views(self) -> Tuple[memoryview, ...]:
+        """
+        memoryviews of (rest_angle, current_angle, length, world_x, world_y,
+        world_angle, tip_x, tip_y): plain-float item access without NumPy's
+        scalar boxing. Rebuilt when the storage arrays are replaced.
+        """
+        views = self._views
+        if views is None or views[3].obj is not self._world_x:
+            views = self._views = tuple(memoryview(col) for col in (
+                self._rest_angle, self._current_angle, self._length, self._world_x,
+                self._world_y, self._world_angle, self._tip_x, self._tip_y,
+            ))
+        return views
+
     def root_bones(self) -> List[Bone]:
-        return [b for b in self.bones.values() if b.parent_id is None]
+        return self.get_children(None)
+
+    def snapshot(self) -> dict:
+        """
+        Export the pose in the same shape as Bone.to_dict per bone, reading
+        the columns as float lists once instead of through the bone proxies.
+        Values are rounded with round(), exactly like Bone.to_dict.
+        """
+        self._ensure_layout()
+        rest, current, wx, wy, wa, tx, ty = np.stack([
+            self._rest_angle, self._current_angle,
+            self._world_x, self._world_y, self._world_angle, self._tip_x, self._tip_y,
+        ]).tolist()
+        length = self._length.tolist()
+        bones = []
+        for b in self._ordered_bones:
+            if b._skeleton is not self:
+                bones.append(b.to_dict())  # no row in the layout
+                continue
+            i = b._index
+            bones.append({
+                "id": b.id,
+                "name": b.name,
+                "parent_id": b.parent_id,
+                "length": length[i],
+                "rest_angle": round(rest[i], 4),
+                "current_angle": round(current[i], 4),
+                "world_x": round(wx[i], 4),
+                "world_y": round(wy[i], 4),
+                "world_angle": round(wa[i], 4),
+                "tip": (round(tx[i], 4), round(ty[i], 4)),
+            })
+        return {"root": (self.root_x, self.root_y), "bones": bones}
 
     def to_dict(self) -> dict:
-        return {
-            "root": (self.root_x, self.root_y),
-            "bones": [b.to_dict() for b in sorted(self.bones.values(), key=lambda b: b.id)],
-        }
+        return self.snapshot()
 
 
 # ---------------------------------------------------------------------------
 # FK
 # ---------------------------------------------------------------------------
 
+@_jit
+def _fk_kernel(parent_idx, rest, current, length, root_x, root_y, wx, wy, wa, tx, ty):
+    """Per-bone FK over rows in parent-first order."""
+    for i in range(parent_idx.shape[0]):
+        p = parent_idx[i]
+        if p < 0:
+            wx[i] = root_x
+            wy[i] = root_y
+            wa[i] = rest[i] + current[i]
+        else:
+            wx[i] = tx[p]
+            wy[i] = ty[p]
+            wa[i] = wa[p] + rest[i] + current[i]
+        tx[i] = wx[i] + length[i] * math.cos(wa[i])
+        ty[i] = wy[i] + length[i] * math.sin(wa[i])
+
+
+# Without Numba, hierarchies averaging fewer bones per depth level than this
+# are cheaper to walk bone by bone than level by level with NumPy.
+_FK_MIN_LEVEL_WIDTH = 16
+# Generating straight-line FK costs ~50 us per bone, so larger skeletons stay
+# on _fk_levels rather than pay seconds of codegen on their first FK.
+_FK_MAX_COMPILED_BONES = 1024
+
+
+def _fk_levels(levels, rest, current, length, root_x, root_y, wx, wy, wa, tx, ty, dx, dy):
+    """
+    Level-by-level FK over a Skeleton's arrays, or the (K, N) matrices of a
+    SkeletonGroup: world angles accumulate down the levels, cos/sin run once
+    over every bone, then each level is placed at its parents' tips.
+    ``dx``/``dy`` are scratch arrays of the same shape.
+    """
+    np.add(rest, current, out=wa)
+    for start, stop, parents in levels[1:]:
+        wa[..., start:stop] += wa[..., parents]
+
+    np.cos(wa, out=dx)
+    dx *= length
+    np.sin(wa, out=dy)
+    dy *= length
+
+    _, n_roots, _ = levels[0]
+    wx[..., :n_roots] = root_x
+    wy[..., :n_roots] = root_y
+    for start, stop, parents in levels[1:]:
+        wx[..., start:stop] = wx[..., parents] + dx[..., parents]
+        wy[..., start:stop] = wy[..., parents] + dy[..., parents]
+    np.add(wx, dx, out=tx)
+    np.add(wy, dy, out=ty)
+
+
+def _tuple_source(names) -> str:
+    """Tuple display for generated code; valid for zero or one names too."""
+    return "(" + "".join(f"{name}, " for name in names) + ")"
+
+
+@functools.lru_cache(maxsize=64)  # keyed by topology (the parent_idx tuple)
+def _compile_fk(parent_rows: Tuple[int, ...]) -> Callable:
+    """
+    Generate FK for one topology as unrolled source: one block per bone with
+    the parent baked in as a local, so there is no loop, indexing or
+    root/child branch at run time. Lengths and angles stay arguments.
+    """
+    lines = [
+        "def fk(rest, current, length, root_x, root_y, wx, wy, wa, tx, ty):",
+        "    r = rest.tolist()",
+        "    c = current.tolist()",
+        "    l = length.tolist()",
+    ]
+    origin_x = []
+    origin_y = []
+    for i, p in enumerate(parent_rows):
+        if p < 0:
+            lines.append(f"    a{i} = r[{i}] + c[{i}]")
+            px, py = "root_x", "root_y"
+        else:
+            lines.append(f"    a{i} = a{p} + r[{i}] + c[{i}]")
+            px, py = f"x{p}", f"y{p}"
+        lines.append(f"    x{i} = {px} + l[{i}] * cos(a{i})")
+        lines.append(f"    y{i} = {py} + l[{i}] * sin(a{i})")
+        origin_x.append(px)
+        origin_y.append(py)
+    n = len(parent_rows)
+    lines += [
+        f"    wx[:] = {_tuple_source(origin_x)}",
+        f"    wy[:] = {_tuple_source(origin_y)}",
+        f"    wa[:] = {_tuple_source(f'a{i}' for i in range(n))}",
+        f"    tx[:] = {_tuple_source(f'x{i}' for i in range(n))}",
+        f"    ty[:] = {_tuple_source(f'y{i}' for i in range(n))}",
+    ]
+    namespace = {"cos": math.cos, "sin": math.sin}
+    exec("\n".join(lines), namespace)
+    return namespace["fk"]
+
+
 def calculate_forward_kinematics(skeleton: Skeleton):
-    """Update world positions of all bones via FK traversal."""
-    def _process(bone_id: int, parent_world_x: float, parent_world_y: float, parent_world_angle: float):
-        bone = skeleton.get_bone(bone_id)
-        if not bone:
-            return
-        bone.world_x = parent_world_x
-        bone.world_y = parent_world_y
-        bone.world_angle = parent_world_angle + bone.rest_angle + bone.current_angle
-        # Process children
-        for child in skeleton.get_children(bone_id):
-            _process(child.id, bone.tip_x, bone.tip_y, bone.world_angle)
+    """
+    Update world positions of all bones via FK.
+    Every path is a single linear pass in parent-first order, never a
+    recursion: compiled per bone with Numba, generated straight-line Python
+    (Skeleton.compile_fk) for narrow/deep hierarchies up to
+    _FK_MAX_COMPILED_BONES bones, otherwise level by level with NumPy.
+    """
+    skeleton._ensure_layout()
+    levels = skeleton._levels
+    if not levels:
+        return
+
+    sk = skeleton
+    if njit is not None:
+        _fk_kernel(
+            sk._parent_idx, sk._rest_angle, sk._current_angle, sk._length,
+            float(sk.root_x), float(sk.root_y),
+            sk._world_x, sk._world_y, sk._world_angle, sk._tip_x, sk._tip_y,
+        )
+    elif len(sk._ids) <= _FK_MAX_COMPILED_BONES and len(sk._ids) < len(levels) * _FK_MIN_LEVEL_WIDTH:
+        sk.compile_fk()(
+            sk._rest_angle, sk._current_angle, sk._length, sk.root_x, sk.root_y,
+            sk._world_x, sk._world_y, sk._world_angle, sk._tip_x, sk._tip_y,
+        )
+    else:
+        _fk_levels(
+            levels, sk._rest_angle, sk._current_angle, sk._length, sk.root_x, sk.root_y,
+            sk._world_x, sk._world_y, sk._world_angle, sk._tip_x, sk._tip_y, sk._dx, sk._dy,
+        )
+    skeleton._dirty = False
+
+
+# ---------------------------------------------------------------------------
+# Batch FK
+# ---------------------------------------------------------------------------
 
-    for root_bone in skeleton.root_bones():
-        _process(root_bone.id, skeleton.root_x, skeleton.root_y, 0.0)
+class SkeletonGroup:
+    """
+    Skeletons sharing one bone hierarchy, solved together by batch FK.
+    The group owns (K, N) matrices for every per-bone column and each
+    member's arrays become row views of them, so poses set through bones or
+    animators feed the batch and its results show up on every skeleton.
+    Adding bones to a member detaches it; batch FK then rebuilds the group,
+    or raises ValueError if the hierarchies no longer match.
+    """
+
+    def __init__(self, skeletons: List[Skeleton]):
+        if not skeletons:
+            raise ValueError("SkeletonGroup needs at least one skeleton")
+        self.skeletons: List[Skeleton] = list(skeletons)
+        self._build()
+
+    def _build(self):
+        first = self.skeletons[0]
+        for sk in self.skeletons[1:]:
+            if not np.array_equal(sk.parent_idx, first.parent_idx):
+                raise ValueError("Skeletons in a group must share the same bone hierarchy")
+        self.parent_idx = first.parent_idx
+        self._levels = first._levels
+        for name in _LAYOUT_COLUMNS + ("_dx", "_dy"):
+            storage = "_" + name.lstrip("_")
+            matrix = np.stack([getattr(sk, storage) for sk in self.skeletons])
+            setattr(self, name, matrix)
+            for k, sk in enumerate(self.skeletons):
+                setattr(sk, storage, matrix[k])
+
+    def __len__(self) -> int:
+        return len(self.skeletons)
+
+    def _owns(self, skeleton: Skeleton) -> bool:
+        """Whether the skeleton's arrays are still row views of this group."""
+        skeleton._ensure_layout()
+        return skeleton._world_x.base is self.world_x
+
+    def _ensure_layout(self):
+        """Re-stack the group if add_bone detached a member since the last build."""
+        if not all(self._owns(sk) for sk in self.skeletons):
+            self._build()
+
+
+def calculate_forward_kinematics_batch(skeletons) -> SkeletonGroup:
+    """
+    FK for many skeletons at once, vectorized across the batch.
+    Accepts a SkeletonGroup or a list of same-topology skeletons (grouped
+    on the fly); returns the group so callers can reuse it every frame.
+    """
+    group = skeletons if isinstance(skeletons, SkeletonGroup) else SkeletonGroup(skeletons)
+    group._ensure_layout()
+    if group._levels:
+        g = group
+        root_x = np.array([[sk.root_x] for sk in g.skeletons], dtype=np.float64)
+        root_y = np.array([[sk.root_y] for sk in g.skeletons], dtype=np.float64)
+        _fk_levels(
+            g._levels, g.rest_angle, g.current_angle, g.length, root_x, root_y,
+            g.world_x, g.world_y, g.world_angle, g.tip_x, g.tip_y, g._dx, g._dy,
+        )
+    for sk in group.skeletons:
+        sk._dirty = False
+    return group
 
 
 # ---------------------------------------------------------------------------
 # IK — FABRIK
 # ---------------------------------------------------------------------------
 
+@_jit
+def _fabrik_kernel(positions, bone_lengths, target_x, target_y, iterations, tolerance):
+    """FABRIK reaching passes on an (n + 1, 2) position array, in place."""
+    n = bone_lengths.shape[0]
+    root_x = positions[0, 0]
+    root_y = positions[0, 1]
+    for _ in range(iterations):
+        # Forward reaching
+        positions[n, 0] = target_x
+        positions[n, 1] = target_y
+        for i in range(n - 1, -1, -1):
+            dx = positions[i, 0] - positions[i + 1, 0]
+            dy = positions[i, 1] - positions[i + 1, 1]
+            lam = bone_lengths[i] * (1.0 / max(math.hypot(dx, dy), 1e-9))
+            positions[i, 0] = (1 - lam) * positions[i + 1, 0] + lam * positions[i, 0]
+            positions[i, 1] = (1 - lam) * positions[i + 1, 1] + lam * positions[i, 1]
+        # Backward reaching
+        positions[0, 0] = root_x
+        positions[0, 1] = root_y
+        for i in range(n):
+            dx = positions[i + 1, 0] - positions[i, 0]
+            dy = positions[i + 1, 1] - positions[i, 1]
+            lam = bone_lengths[i] * (1.0 / max(math.hypot(dx, dy), 1e-9))
+            positions[i + 1, 0] = (1 - lam) * positions[i, 0] + lam * positions[i + 1, 0]
+            positions[i + 1, 1] = (1 - lam) * positions[i, 1] + lam * positions[i + 1, 1]
+
+        dx = positions[n, 0] - target_x
+        dy = positions[n, 1] - target_y
+        if math.hypot(dx, dy) < tolerance:
+            return True
+    return False
+
+
+@_jit
+def _ik_kernel(
+    rows, rest, current, length, wx, wy, wa, tx, ty, target_x, target_y, iterations, tolerance,
+):
+    """
+    IK for a chain of layout rows starting at a root bone: gather the joint
+    positions, solve, and write current/world/tip back, all in one call.
+    """
+    n = rows.shape[0]
+    positions = np.empty((n + 1, 2))
+    bone_lengths = np.empty(n)
+    total_length = 0.0
+    for i in range(n):
+        r = rows[i]
+        positions[i, 0] = wx[r]
+        positions[i, 1] = wy[r]
+        bone_lengths[i] = length[r]
+        total_length += length[r]
+    positions[n, 0] = tx[rows[n - 1]]
+    positions[n, 1] = ty[rows[n - 1]]
+    root_x = positions[0, 0]
+    root_y = positions[0, 1]
+
+    dist_to_target = math.hypot(target_x - root_x, target_y - root_y)
+    if dist_to_target > total_length:
+        # Out of reach: every joint lands on the root→target line
+        inv_dist = 1.0 / max(dist_to_target, 1e-9)
+        ux = (target_x - root_x) * inv_dist
+        uy = (target_y - root_y) * inv_dist
+        reach = 0.0
+        for i in range(n):
+            reach += bone_lengths[i]
+            positions[i + 1, 0] = root_x + reach * ux
+            positions[i + 1, 1] = root_y + reach * uy
+    else:
+        _fabrik_kernel(positions, bone_lengths, target_x, target_y, iterations, tolerance)
+
+    parent_world_angle = 0.0
+    for i in range(n):
+        r = rows[i]
+        angle = math.atan2(positions[i + 1, 1] - positions[i, 1], positions[i + 1, 0] - positions[i, 0])
+        current[r] = angle - parent_world_angle - rest[r]
+        wx[r] = positions[i, 0]
+        wy[r] = positions[i, 1]
+        wa[r] = angle
+        tx[r] = positions[i + 1, 0]
+        ty[r] = positions[i + 1, 1]
+        parent_world_angle = angle
+    return math.hypot(positions[n, 0] - target_x, positions[n, 1] - target_y) < tolerance
+
+
+# Without Numba, chains of at least this many bones gather and write back
+# with fancy indexing and one np.arctan2; shorter ones loop over memoryviews.
+_IK_MIN_VECTOR_BONES = 48
+
+
+def _fabrik_lists(xs, ys, bone_lengths, target_x, target_y, iterations, tolerance):
+    """_fabrik_kernel on plain float lists, for when Numba is not installed."""
+    n = len(bone_lengths)
+    root_x = xs[0]
+    root_y = ys[0]
+    hypot = math.hypot
+    for _ in range(iterations):
+        # Forward reaching
+        qx = target_x
+        qy = target_y
+        xs[n] = qx
+        ys[n] = qy
+        for i in range(n - 1, -1, -1):
+            px = xs[i]
+            py = ys[i]
+            r = hypot(px - qx, py - qy)
+            lam = bone_lengths[i] / (r if r > 0 else 1e-9)
+            qx = (1 - lam) * qx + lam * px
+            qy = (1 - lam) * qy + lam * py
+            xs[i] = qx
+            ys[i] = qy
+        # Backward reaching
+        px = root_x
+        py = root_y
+        xs[0] = px
+        ys[0] = py
+        for i in range(n):
+            qx = xs[i + 1]
+            qy = ys[i + 1]
+            r = hypot(qx - px, qy - py)
+            lam = bone_lengths[i] / (r if r > 0 else 1e-9)
+            px = (1 - lam) * px + lam * qx
+            py = (1 - lam) * py + lam * qy
+            xs[i + 1] = px
+            ys[i + 1] = py
+
+        if hypot(px - target_x, py - target_y) < tolerance:
+            return True
+    return False
+
+
+def _reach_lists(xs, ys, bone_lengths, target_x, target_y, iterations, tolerance):
+    """Move the joint positions in xs/ys toward the target (pure Python)."""
+    root_x = xs[0]
+    root_y = ys[0]
+    dist_to_target = math.hypot(target_x - root_x, target_y - root_y)
+    if dist_to_target > sum(bone_lengths):
+        # Target out of reach — stretch toward it: every joint lands on the
+        # root→target line at the cumulative bone length
+        inv_dist = 1.0 / max(dist_to_target, 1e-9)
+        ux = (target_x - root_x) * inv_dist
+        uy = (target_y - root_y) * inv_dist
+        reach = 0.0
+        for i, bone_length in enumerate(bone_lengths):
+            reach += bone_length
+            xs[i + 1] = root_x + reach * ux
+            ys[i + 1] = root_y + reach * uy
+    else:
+        _fabrik_lists(xs, ys, bone_lengths, target_x, target_y, iterations, tolerance)
+
+
+def _ik_rows(skeleton: Skeleton, rows: List[int], target_x, target_y, iterations, tolerance) -> bool:
+    """_ik_kernel in plain Python, through the skeleton's column memoryviews."""
+    rest, current, length, wx, wy, wa, tip_x, tip_y = skeleton._column_views()
+    xs = []
+    ys = []
+    bone_lengths = []
+    for r in rows:
+        xs.append(wx[r])
+        ys.append(wy[r])
+        bone_lengths.append(length[r])
+    xs.append(tip_x[rows[-1]])
+    ys.append(tip_y[rows[-1]])
+    _reach_lists(xs, ys, bone_lengths, target_x, target_y, iterations, tolerance)
+
+    atan2 = math.atan2
+    px = xs[0]
+    py = ys[0]
+    parent_world_angle = 0.0  # the chain starts at a root bone
+    for i, r in enumerate(rows, 1):
+        qx = xs[i]
+        qy = ys[i]
+        angle = atan2(qy - py, qx - px)
+        current[r] = angle - parent_world_angle - rest[r]
+        wx[r] = px
+        wy[r] = py
+        wa[r] = angle
+        tip_x[r] = qx
+        tip_y[r] = qy
+        px = qx
+        py = qy
+        parent_world_angle = angle
+    return math.hypot(px - target_x, py - target_y) < tolerance
+
+
+def _ik_rows_vectorized(skeleton: Skeleton, rows: List[int], rows_arr: np.ndarray,
+                        target_x, target_y, iterations, tolerance) -> bool:
+    """_ik_rows for long chains: whole-chain NumPy gather and writeback."""
+    sk = skeleton
+    xs = sk._world_x[rows_arr].tolist()
+    ys = sk._world_y[rows_arr].tolist()
+    xs.append(sk._tip_x.item(rows[-1]))
+    ys.append(sk._tip_y.item(rows[-1]))
+    _reach_lists(xs, ys, sk._length[rows_arr].tolist(), target_x, target_y, iterations, tolerance)
+
+    positions_x = np.array(xs)
+    positions_y = np.array(ys)
+    world_angle = np.arctan2(np.diff(positions_y), np.diff(positions_x))
+    parent_world_angle = np.empty_like(world_angle)
+    parent_world_angle[0] = 0.0  # the chain starts at a root bone
+    parent_world_angle[1:] = world_angle[:-1]
+    sk._current_angle[rows_arr] = world_angle - parent_world_angle - sk._rest_angle[rows_arr]
+    sk._world_x[rows_arr] = positions_x[:-1]
+    sk._world_y[rows_arr] = positions_y[:-1]
+    sk._world_angle[rows_arr] = world_angle
+    sk._tip_x[rows_arr] = positions_x[1:]
+    sk._tip_y[rows_arr] = positions_y[1:]
+    return math.hypot(xs[-1] - target_x, ys[-1] - target_y) < tolerance
+
+
 def calculate_inverse_kinematics(
     skeleton: Skeleton,
     end_effector_id: int,
@@ -166,90 +1014,68 @@ def calculate_inverse_kinematics(
     FABRIK (Forward And Backward Reaching Inverse Kinematics).
     Returns True if converged within tolerance.
     """
+    skeleton._ensure_layout()
+    target_x = float(target_x)
+    target_y = float(target_y)
+    chain_rows = skeleton._chain_rows(end_effector_id)
+    if chain_rows is not None:
+        rows, rows_arr = chain_rows
+        if len(rows) < 2:
+            return False
+        skeleton._dirty = True
+        if njit is not None:
+            sk = skeleton
+            return bool(_ik_kernel(
+                rows_arr, sk._rest_angle, sk._current_angle, sk._length,
+                sk._world_x, sk._world_y, sk._world_angle, sk._tip_x, sk._tip_y,
+                target_x, target_y, iterations, tolerance,
+            ))
+        if len(rows) >= _IK_MIN_VECTOR_BONES:
+            return _ik_rows_vectorized(
+                skeleton, rows, rows_arr, target_x, target_y, iterations, tolerance,
+            )
+        return _ik_rows(skeleton, rows, target_x, target_y, iterations, tolerance)
+
+    # Chain hangs off a missing parent, so it has no rows in the layout
     chain = skeleton.get_chain(end_effector_id)
     if len(chain) < 2:
         return False
-
-    # Collect current positions
-    positions: List[Tuple[float, float]] = []
-    for bone in chain:
-        positions.append((bone.world_x, bone.world_y))
-    # Add tip of last bone
-    last = chain[-1]
-    positions.append((last.tip_x, last.tip_y))
-
-    bone_lengths = [b.length for b in chain]
-    root_pos = positions[0]
-    target = (target_x, target_y)
-
-    # Total chain length
-    total_length = sum(bone_lengths)
-    dist_to_target = math.dist(root_pos, target)
-
-    if dist_to_target > total_length:
-        # Target out of reach — stretch toward it
-        for i in range(len(positions) - 1):
-            r = math.dist(positions[i], target)
-            lam = bone_lengths[i] / (r if r > 0 else 1e-9)
-            nx = (1 - lam) * positions[i][0] + lam * target[0]
-            ny = (1 - lam) * positions[i][1] + lam * target[1]
-            positions[i + 1] = (nx, ny)
-    else:
-        for _ in range(iterations):
-            # Forward reaching
-            positions[-1] = target
-            for i in range(len(positions) - 2, -1, -1):
-                r = math.dist(positions[i], positions[i + 1])
-                lam = bone_lengths[i] / (r if r > 0 else 1e-9)
-                nx = (1 - lam) * positions[i + 1][0] + lam * positions[i][0]
-                ny = (1 - lam) * positions[i + 1][1] + lam * positions[i][1]
-                positions[i] = (nx, ny)
-            # Backward reaching
-            positions[0] = root_pos
-            for i in range(len(positions) - 1):
-                r = math.dist(positions[i], positions[i + 1])
-                lam = bone_lengths[i] / (r if r > 0 else 1e-9)
-                nx = (1 - lam) * positions[i][0] + lam * positions[i + 1][0]
-                ny = (1 - lam) * positions[i][1] + lam * positions[i + 1][1]
-                positions[i + 1] = (nx, ny)
-
-            if math.dist(positions[-1], target) < tolerance:
-                break
+    xs = [b.world_x for b in chain] + [chain[-1].tip_x]
+    ys = [b.world_y for b in chain] + [chain[-1].tip_y]
+    _reach_lists(xs, ys, [b.length for b in chain], target_x, target_y, iterations, tolerance)
 
     # Apply positions back to bones as angles
+    parent = skeleton.get_bone(chain[0].parent_id) if chain[0].parent_id is not None else None
+    parent_world_angle = parent.world_angle if parent else 0.0
     for i, bone in enumerate(chain):
-        px, py = positions[i]
-        qx, qy = positions[i + 1]
-        dx, dy = qx - px, qy - py
-        world_angle = math.atan2(dy, dx)
-        parent_world_angle = 0.0
-        if bone.parent_id is not None:
-            parent = skeleton.get_bone(bone.parent_id)
-            if parent:
-                parent_world_angle = parent.world_angle
-        bone.current_angle = world_angle - parent_world_angle - bone.rest_angle
-        bone.world_x = px
-        bone.world_y = py
-        bone.world_angle = world_angle
-
-    # Final tip of last bone
-    last_bone = chain[-1]
-    qx, qy = positions[-1]
-
-    return math.dist(positions[-1], target) < tolerance
+        angle = math.atan2(ys[i + 1] - ys[i], xs[i + 1] - xs[i])
+        bone.current_angle = angle - parent_world_angle - bone.rest_angle
+        bone.world_x = xs[i]
+        bone.world_y = ys[i]
+        bone.world_angle = angle
+        parent_world_angle = angle
+    n = len(chain)
+    return math.hypot(xs[n] - target_x, ys[n] - target_y) < tolerance
 
 
 # ---------------------------------------------------------------------------
 # Keyframe & Clip
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Keyframe:
-    """A single keyframe of bone angles at a given time."""
+    """
+    A single keyframe of bone angles at a given time.
+    Immutable (``bone_angles`` is a read-only copy) so a clip's baked
+    sampling data can never go stale behind its back.
+    """
     time: float                          # seconds
-    bone_angles: Dict[int, float]        # bone_id → angle
+    bone_angles: Mapping[int, float]     # bone_id → angle
     easing: InterpolationType = InterpolationType.LINEAR
 
+    def __post_init__(self):
+        object.__setattr__(self, "bone_angles", MappingProxyType(dict(self.bone_angles)))
+
     def to_dict(self) -> dict:
         return {
             "time": self.time,
@@ -258,14 +1084,35 @@ class Keyframe:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Clip:
-    """Animation clip containing keyframes."""
+    """
+    Animation clip containing keyframes.
+    ``keyframes`` is a tuple; add_keyframe replaces it. Keyframes are baked
+    lazily for sampling: ``_times`` and ``_easing`` codes per keyframe,
+    ``_bone_ids`` (union over the clip) and ``_angles`` with one row per
+    keyframe (also kept as float lists in ``_rows``). A bone missing from a
+    keyframe holds its nearest keyed value. The bake is redone whenever
+    ``keyframes`` is no longer the tuple it was baked from.
+    """
     name: str
-    keyframes: List[Keyframe] = field(default_factory=list)
+    keyframes: Tuple[Keyframe, ...] = ()
     loop: bool = True
     fps: float = 24.0
     loop_mode: LoopMode = LoopMode.LOOP
+    _baked_from: Optional[Tuple[Keyframe, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _times: List[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _bone_ids: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _bone_id_list: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _angles: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _rows: List[List[float]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _easing: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _hint_idx: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.keyframes = tuple(self.keyframes)
 
     @property
     def duration(self) -> float:
@@ -273,15 +1120,48 @@ class Clip:
             return 0.0
         return self.keyframes[-1].time
 
-    def add_keyframe(self, keyframe: Keyframe):
-        self.keyframes.append(keyframe)
-        self.keyframes.sort(key=lambda k: k.time)
-
-    def sample(self, t: float) -> Dict[int, float]:
-        """Interpolate bone angles at time t."""
-        if not self.keyframes:
-            return {}
+    @property
+    def bone_ids(self) -> np.ndarray:
+        """Bone ids matching the entries returned by :meth:`sample_vec`."""
+        if self._baked_from is not self.keyframes:
+            self._bake()
+        return self._bone_ids
 
+    def add_keyframe(self, keyframe: Keyframe):
+        self.keyframes = tuple(sorted(self.keyframes + (keyframe,), key=lambda k: k.time))
+
+    def _bake(self):
+        # A list assigned to ``keyframes`` is frozen here, so later edits need a new assignment
+        kfs = self.keyframes = tuple(self.keyframes)
+        bone_ids = sorted(set().union(*(k.bone_angles for k in kfs)))
+        column = {bid: j for j, bid in enumerate(bone_ids)}
+        angles = np.full((len(kfs), len(bone_ids)), np.nan, dtype=np.float64)
+        for i, k in enumerate(kfs):
+            for bid, angle in k.bone_angles.items():
+                angles[i, column[bid]] = angle
+        # Fill gaps forward, then backward for bones keyed only later on
+        for i in range(1, len(kfs)):
+            gaps = np.isnan(angles[i])
+            angles[i, gaps] = angles[i - 1, gaps]
+        for i in range(len(kfs) - 2, -1, -1):
+            gaps = np.isnan(angles[i])
+            angles[i, gaps] = angles[i + 1, gaps]
+
+        self._times = [float(k.time) for k in kfs]
+        self._bone_ids = np.array(bone_ids, dtype=np.int32)
+        self._bone_id_list = bone_ids
+        self._angles = angles
+        self._rows = angles.tolist()
+        self._easing = [_EASING_CODES[k.easing] for k in kfs]
+        self._hint_idx = 0
+        self._baked_from = kfs
+
+    def _locate(self, t: float) -> Tuple[int, float]:
+        """
+        Keyframe row and eased blend factor toward the next row at time t.
+        Plain floats throughout: the hint and bisect run on ``_times``.
+        """
+        times = self._times
         # Handle looping
         duration = self.duration
         if duration > 0:
@@ -294,32 +1174,54 @@ class Clip:
                 t = min(t, duration)
 
         # Find surrounding keyframes
-        kfs = self.keyframes
-        if t <= kfs[0].time:
-            return dict(kfs[0].bone_angles)
-        if t >= kfs[-1].time:
-            return dict(kfs[-1].bone_angles)
-
-        for i in range(len(kfs) - 1):
-            k0, k1 = kfs[i], kfs[i + 1]
-            if k0.time <= t <= k1.time:
-                span = k1.time - k0.time
-                alpha = (t - k0.time) / span if span > 0 else 0.0
-                # Cubic ease
-                if k0.easing == InterpolationType.CUBIC:
-                    alpha = alpha * alpha * (3 - 2 * alpha)
-                elif k0.easing == InterpolationType.STEP:
-                    alpha = 0.0
-
-                result = {}
-                all_ids = set(k0.bone_angles) | set(k1.bone_angles)
-                for bid in all_ids:
-                    a0 = k0.bone_angles.get(bid, 0.0)
-                    a1 = k1.bone_angles.get(bid, 0.0)
-                    result[bid] = a0 + (a1 - a0) * alpha
-                return result
-
-        return dict(kfs[-1].bone_angles)
+        if t <= times[0]:
+            return 0, 0.0
+        if t >= times[-1]:
+            return len(times) - 1, 0.0
+        # Playback advances monotonically: try the last interval and the one
+        # after it before searching (a loop wrap falls through to the search)
+        i = self._hint_idx
+        if not times[i] <= t < times[i + 1]:
+            if i + 2 < len(times) and times[i + 1] <= t < times[i + 2]:
+                i += 1
+            else:
+                i = bisect.bisect_right(times, t) - 1
+            self._hint_idx = i
+
+        span = times[i + 1] - times[i]
+        alpha = (t - times[i]) / span if span > 0 else 0.0
+        easing = self._easing[i]
+        # Cubic ease
+        if easing == _EASE_CUBIC:
+            alpha = alpha * alpha * (3 - 2 * alpha)
+        elif easing == _EASE_STEP:
+            alpha = 0.0
+        return i, alpha
+
+    def sample_vec(self, t: float) -> np.ndarray:
+        """Interpolate bone angles at time t, aligned with :attr:`bone_ids`."""
+        if self._baked_from is not self.keyframes:
+            self._bake()
+        if not self._times:
+            return np.empty(0, dtype=np.float64)
+        i, alpha = self._locate(t)
+        a0 = self._angles[i]
+        if alpha == 0.0:
+            return a0.copy()
+        return a0 + (self._angles[i + 1] - a0) * alpha
+
+    def sample(self, t: float) -> Dict[int, float]:
+        """Interpolate bone angles at time t."""
+        if self._baked_from is not self.keyframes:
+            self._bake()
+        if not self._times:
+            return {}
+        i, alpha = self._locate(t)
+        r0 = self._rows[i]
+        if alpha == 0.0:
+            return dict(zip(self._bone_id_list, r0))
+        r1 = self._rows[i + 1]
+        return {bid: a0 + (a1 - a0) * alpha for bid, a0, a1 in zip(self._bone_id_list, r0, r1)}
 
     def to_dict(self) -> dict:
         return {
@@ -350,6 +1252,12 @@ class Animator:
         self._speed: float = 1.0
         self._blend_duration: float = 0.0
         self._blend_time: float = 0.0
+        # clip name -> (skeleton index map, clip bone ids, pose columns, skeleton rows)
+        self._apply_idx: Dict[str, Tuple[dict, np.ndarray, np.ndarray, np.ndarray]] = {}
+        # (clip, blend clip) names -> (clip rows, blend clip rows, union of both)
+        self._blend_idx: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._pose_a = np.zeros(0)  # blend scratch, one slot per skeleton row
+        self._pose_b = np.zeros(0)
 
     def add_clip(self, clip: Clip):
         self.clips[clip.name] = clip
@@ -417,29 +1325,73 @@ class Animator:
         # Sample current pose
         if self.current_clip and self.current_clip in self.clips:
             clip = self.clips[self.current_clip]
-            pose = clip.sample(self._time)
+            cols, rows = self._clip_rows(clip)
+            pose = clip.sample_vec(self._time)
+            current = self.skeleton.current_angle
             # Blend if needed
             if self.blend_clip and self.blend_clip in self.clips:
-                blend_pose = self.clips[self.blend_clip].sample(self._time)
-                all_ids = set(pose) | set(blend_pose)
-                blended = {}
-                for bid in all_ids:
-                    a = pose.get(bid, 0.0)
-                    b = blend_pose.get(bid, 0.0)
-                    blended[bid] = a + (b - a) * self.blend_alpha
-                pose = blended
-
-            # Apply angles to skeleton
-            for bone_id, angle in pose.items():
-                bone = self.skeleton.get_bone(bone_id)
-                if bone:
-                    bone.current_angle = angle
+                other = self.clips[self.blend_clip]
+                other_cols, other_rows = self._clip_rows(other)
+                union = self._blend_rows(rows, other_rows)
+                if len(self._pose_a) != len(current):
+                    self._pose_a = np.zeros(len(current))
+                    self._pose_b = np.zeros(len(current))
+                # Both poses in skeleton row order; a bone keyed by one clip only blends with 0
+                a = self._pose_a
+                b = self._pose_b
+                a.fill(0.0)
+                b.fill(0.0)
+                a[rows] = pose[cols]
+                b[other_rows] = other.sample_vec(self._time)[other_cols]
+                b -= a
+                b *= self.blend_alpha
+                a += b
+                current[union] = a[union]
+            else:
+                # Apply angles to skeleton
+                current[rows] = pose[cols]
+            self.skeleton._dirty = True
 
             calculate_forward_kinematics(self.skeleton)
 
+    def _clip_rows(self, clip: Clip) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Columns of the clip's sampled pose and the skeleton rows they drive.
+        Cached per clip; rebuilt only after the skeleton layout or the
+        clip's baked arrays are replaced.
+        """
+        self.skeleton._ensure_layout()
+        index_of = self.skeleton._index_of
+        bone_ids = clip.bone_ids
+        cached = self._apply_idx.get(clip.name)
+        if cached is not None and cached[0] is index_of and cached[1] is bone_ids:
+            return cached[2], cached[3]
+        cols: List[int] = []
+        rows: List[int] = []
+        for j, bid in enumerate(bone_ids.tolist()):
+            row = index_of.get(bid)
+            if row is not None:
+                cols.append(j)
+                rows.append(row)
+        cols_arr = np.array(cols, dtype=np.intp)
+        rows_arr = np.array(rows, dtype=np.intp)
+        self._apply_idx[clip.name] = (index_of, bone_ids, cols_arr, rows_arr)
+        return cols_arr, rows_arr
+
+    def _blend_rows(self, rows: np.ndarray, other_rows: np.ndarray) -> np.ndarray:
+        """Skeleton rows driven by either blended clip, cached per clip pair."""
+        key = (self.current_clip, self.blend_clip)
+        cached = self._blend_idx.get(key)
+        if cached is not None and cached[0] is rows and cached[1] is other_rows:
+            return cached[2]
+        union = np.union1d(rows, other_rows)
+        self._blend_idx[key] = (rows, other_rows, union)
+        return union
+
     def export_frame(self) -> dict:
-        """Export current skeleton pose."""
-        calculate_forward_kinematics(self.skeleton)
+        """Export current skeleton pose (FK is only re-run if the pose changed)."""
+        if self.skeleton._dirty:
+            calculate_forward_kinematics(self.skeleton)
         return {
             "time": round(self._time, 4),
             "clip": self.current_clip,
@@ -448,6 +1400,41 @@ class Animator:
             "skeleton": self.skeleton.to_dict(),
         }
 
+    def export_frame_bytes(self) -> bytes:
+        """
+        Export the current pose as JSON bytes, e.g. to ship to a renderer.
+        Bone columns are unrounded arrays in skeleton row order, with
+        ``ids``/``names`` giving each row's bone. Serialized by orjson
+        straight from the NumPy arrays when installed, else by json.
+        """
+        sk = self.skeleton
+        if sk._dirty:
+            calculate_forward_kinematics(sk)
+        skeleton = {
+            "root": [sk.root_x, sk.root_y],
+            "ids": sk.ids,
+            "names": sk.names,
+            "length": sk.length,
+            "world_x": sk.world_x,
+            "world_y": sk.world_y,
+            "world_angle": sk.world_angle,
+            "tip_x": sk.tip_x,
+            "tip_y": sk.tip_y,
+        }
+        frame = {
+            "time": self._time,
+            "clip": self.current_clip,
+            "state": self.state.value,
+            "blend_alpha": self.blend_alpha,
+            "skeleton": skeleton,
+        }
+        if orjson is not None:
+            return orjson.dumps(frame, option=orjson.OPT_SERIALIZE_NUMPY)
+        for key, value in skeleton.items():
+            if isinstance(value, np.ndarray):
+                skeleton[key] = value.tolist()
+        return json.dumps(frame).encode()
+
 
 # ---------------------------------------------------------------------------
 # Preset skeletons & clips
@@ -477,26 +1464,27 @@ def make_humanoid_skeleton() -> Skeleton:
 
 def make_walk_clip() -> Clip:
     """Create a simple bipedal walk cycle."""
-    clip = Clip(name="walk", fps=24.0, loop=True, loop_mode=LoopMode.LOOP)
     amplitude = 0.4
-    for frame in range(24):
-        t = frame / 24.0
-        phase = 2 * math.pi * t
-        kf = Keyframe(
-            time=t,
-            bone_angles={
-                1: math.sin(phase) * 0.05,                    # spine sway
-                7: math.sin(phase) * amplitude,                # l_upper_leg
-                8: max(0, -math.sin(phase)) * amplitude * 0.5,
-                9: math.sin(phase + math.pi) * amplitude,      # r_upper_leg
-                10: max(0, math.sin(phase)) * amplitude * 0.5,
-                3: math.sin(phase + math.pi) * amplitude * 0.5,
-                5: math.sin(phase) * amplitude * 0.5,
-            },
-            easing=InterpolationType.CUBIC,
-        )
-        clip.add_keyframe(kf)
-    return clip
+    times = np.arange(24) / 24.0
+    phase = 2 * np.pi * times
+    s = np.sin(phase)
+    s_opp = np.sin(phase + np.pi)
+    channels = {
+        1: s * 0.05,                                # spine sway
+        7: s * amplitude,                           # l_upper_leg
+        8: np.maximum(0.0, -s) * amplitude * 0.5,
+        9: s_opp * amplitude,                       # r_upper_leg
+        10: np.maximum(0.0, s) * amplitude * 0.5,
+        3: s_opp * amplitude * 0.5,
+        5: s * amplitude * 0.5,
+    }
+    bone_ids = list(channels)
+    rows = np.column_stack(list(channels.values())).tolist()
+    keyframes = [
+        Keyframe(time=t, bone_angles=dict(zip(bone_ids, angles)), easing=InterpolationType.CUBIC)
+        for t, angles in zip(times.tolist(), rows)
+    ]
+    return Clip(name="walk", keyframes=keyframes, fps=24.0, loop=True, loop_mode=LoopMode.LOOP)
 
 
 def make_idle_clip() -> Clip: